@@ -61,20 +61,40 @@ class CliHelper():
         text = ">> %s=%s" % (key, value)
         logging.Logger.info(text)
 
+    @staticmethod
+    def _as_bytearray(buff):
+        """
+        Normalise a buffer (list of ints, bytes or a str of byte-valued chars) to a bytearray
+        """
+        if isinstance(buff, (bytearray, bytes, list)):
+            return bytearray(buff)
+        return bytearray(buff, 'latin-1')
+
+    @staticmethod
+    def _first_mismatch(left, right):
+        """
+        Offset of the first element at which the 2 buffers differ
+        """
+        return next(i for i, (a, b) in enumerate(zip(left, right)) if a != b)
+
     def assert_binary_equal(self, left, right):
+        """
+        Asserts if the 2 buffers (Binary) differ
+        """
         asserts.assertEqual(len(left), len(right), "Buffers are not same length %d %d" % (len(left), len(right)))
-        i = 0
-        while i < len(left):
-            asserts.assertEqual(left[i], ord(right[i]), ("Missmatch @offset %d 0x%x <> 0x%x" % (i, left[i], ord(right[i]))) )
-            i = i + 1
+        left = self._as_bytearray(left)
+        right = self._as_bytearray(right)
+        if left == right:
+            return
+        i = self._first_mismatch(left, right)
+        asserts.assertEqual(left[i], right[i], "Missmatch @offset %d 0x%x <> 0x%x" % (i, left[i], right[i]))
 
     def assert_text_equal(self, left, right):
         """
         Asserts if the 2 buffers (Text) differ
         """
         asserts.assertEqual(len(left), len(right), "Buffers are not same length %d %d" % (len(left), len(right)))
-        i = 0
-        while i < len(left):
-            asserts.assertEqual(ord(left[i]), ord(right[i]), ("Missmatch @offset %d %d <> %d" % (i, ord(left[i]), ord(right[i]))) )
-            i = i + 1
-
+        if left == right:
+            return
+        i = self._first_mismatch(left, right)
+        asserts.assertEqual(ord(left[i]), ord(right[i]), "Missmatch @offset %d %d <> %d" % (i, ord(left[i]), ord(right[i])))
@@ -64,6 +64,11 @@ class Cache(object):
     :param no_timeouts: Not used
     :type no_timeouts: bool
     """
+    # index.json is only read when cmsis-pack-manager is not present, and
+    # never changes during a run, so it is parsed once and shared by all
+    # Cache objects
+    _local_index = None
+
     def __init__(self, silent, no_timeouts):
         if _CPM_PRESENT:
             self._cache = _Cache(
@@ -74,7 +79,8 @@ class Cache(object):
             self._cache = None
 
         try:
-            self._legacy_names = load(open(LocalPackLegacyNames))
+            with open(LocalPackLegacyNames) as fd:
+                self._legacy_names = load(fd)
         except IOError:
             self._legacy_names = {}
 
@@ -113,8 +119,10 @@ class Cache(object):
         if _CPM_PRESENT:
             return _CacheLookup(self._cache.index, self._legacy_names)
         else:
-            local_index = load(open(LocalPackIndex))
-            return _CacheLookup(local_index, self._legacy_names)
+            if Cache._local_index is None:
+                with open(LocalPackIndex) as fd:
+                    Cache._local_index = load(fd)
+            return _CacheLookup(Cache._local_index, self._legacy_names)
 
     def cache_descriptors(self):
         if _CPM_PRESENT:
@@ -15,6 +15,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from __future__ import print_function
 import socket
 
 BROADCAST_PORT = 58083
@@ -23,4 +24,4 @@ s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 s.bind(('0.0.0.0', BROADCAST_PORT))
 
 while True:
-    print s.recvfrom(256)
+    print(s.recvfrom(256))
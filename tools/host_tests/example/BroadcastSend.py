@@ -15,6 +15,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from __future__ import print_function
 import socket
 from time import sleep, time
 
@@ -25,7 +26,7 @@ s.bind(('', 0))
 s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
 
 while True:
-    print "Broadcasting..."
+    print("Broadcasting...")
     data = 'Hello World: ' + repr(time()) + '\n'
-    s.sendto(data, ('<broadcast>', BROADCAST_PORT))
+    s.sendto(data.encode(), ('<broadcast>', BROADCAST_PORT))
     sleep(1)
@@ -15,6 +15,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from __future__ import print_function
 import socket
 from time import sleep, time
 
@@ -25,7 +26,7 @@ sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
 sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 2)
 
 while True:
-    print "Multicast to group: %s\n" % MCAST_GRP
+    print("Multicast to group: %s\n" % MCAST_GRP)
     data = 'Hello World: ' + repr(time()) + '\n'
-    sock.sendto(data, (MCAST_GRP, MCAST_PORT))
+    sock.sendto(data.encode(), (MCAST_GRP, MCAST_PORT))
     sleep(1)
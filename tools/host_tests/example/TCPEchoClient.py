@@ -15,6 +15,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from __future__ import print_function
 import socket
 
 ECHO_SERVER_ADDRESS = "10.2.202.45"
@@ -23,7 +24,7 @@ ECHO_PORT = 7
 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 s.connect((ECHO_SERVER_ADDRESS, ECHO_PORT))
 
-s.sendall('Hello, world')
+s.sendall(b'Hello, world')
 data = s.recv(1024)
 s.close()
-print 'Received', repr(data)
+print('Received', repr(data))
@@ -15,6 +15,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from __future__ import print_function
 import socket
 
 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -23,7 +24,7 @@ s.listen(1)
 
 while True:
     conn, addr = s.accept()
-    print 'Connected by', addr
+    print('Connected by', addr)
     while True:
         data = conn.recv(1024)
         if not data: break
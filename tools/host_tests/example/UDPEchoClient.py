@@ -15,6 +15,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from __future__ import print_function
 import socket
 
 ECHO_SERVER_ADDRESS = '10.2.202.45'
@@ -22,8 +23,8 @@ ECHO_PORT = 7
 
 sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
-sock.sendto("Hello World\n", (ECHO_SERVER_ADDRESS, ECHO_PORT))
+sock.sendto(b"Hello World\n", (ECHO_SERVER_ADDRESS, ECHO_PORT))
 response = sock.recv(256)
 sock.close()
 
-print response
+print(response)
@@ -15,6 +15,7 @@ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 See the License for the specific language governing permissions and
 limitations under the License.
 """
+from __future__ import print_function
 import socket
 
 ECHO_PORT = 7
@@ -24,5 +25,5 @@ sock.bind(('', ECHO_PORT))
 
 while True:
     data, address = sock.recvfrom(256)
-    print "datagram from", address
+    print("datagram from", address)
     sock.sendto(data, address)
@@ -17,7 +17,7 @@ limitations under the License.
 """
 
 from os.path import join, basename
-from host_test_plugins import HostTestPluginBase
+from .host_test_plugins import HostTestPluginBase
 
 
 class HostTestPluginCopyMethod_Firefox(HostTestPluginBase):
@@ -49,7 +49,7 @@ class HostTestPluginCopyMethod_Firefox(HostTestPluginBase):
         """
         try:
             from selenium import webdriver
-        except ImportError, e:
+        except ImportError as e:
             self.print_plugin_error("Error: firefox copy method requires selenium library. %s"% e)
             return False
         return True
@@ -24,6 +24,8 @@ import subprocess
 import logging
 import argparse
 import re
+from collections import defaultdict
+from multiprocessing.pool import ThreadPool
 from os.path import dirname, abspath, join, isfile, normpath
 
 # Be sure that the tools directory is in the search path
@@ -34,6 +36,13 @@ from tools.utils import delete_dir_files, mkdir, copy_file
 
 rel_log = logging.getLogger("Importer")
 
+# Number of files copied concurrently
+COPY_JOBS = 8
+
+# Trailer added by 'git cherry-pick -x' to the commit message
+CHERRY_PICK_PATTERN = re.compile(
+    br'^\s*\(cherry picked from commit ([0-9a-fA-F]+)\)$', re.MULTILINE)
+
 
 class StoreDir(argparse.Action):
     def __call__(self, parser, namespace, values, option_string=None):
@@ -63,42 +72,88 @@ class DirContext(object):
         os.chdir(self.dir)
 
 
-def del_file(name):
+def index_files():
     """
-    Delete the file in RTOS/CMSIS/features directory of mbed-os.
+    Index the files in RTOS/CMSIS/features directory of mbed-os by name.
 
-    :param name: Name of the file.
-    :return: None.
+    :return: Dictionary of file name to the list of paths with that name.
     """
 
-    result = []
+    result = defaultdict(list)
     search_path = [join(ROOT, 'rtos'), join(ROOT, 'cmsis'),
                    join(ROOT, 'features')]
     for path in search_path:
         for root, dirs, files in os.walk(path):
-            if name in files:
-                result.append(join(root, name))
-    for f in result:
-        os.remove(f)
-        rel_log.debug("Deleted %s", os.path.relpath(f, ROOT))
+            for name in files:
+                result[name].append(join(root, name))
+    return result
+
+
+def del_file(name, file_index):
+    """
+    Delete the file in RTOS/CMSIS/features directory of mbed-os.
+
+    :param name: Name of the file.
+    :param file_index: Index of mbed-os files, as returned by index_files().
+    :return: None.
+    """
+
+    for f in file_index.pop(name, []):
+        # Could already be gone as the dest_file of an earlier entry
+        if isfile(f):
+            os.remove(f)
+            rel_log.debug("Deleted %s", os.path.relpath(f, ROOT))
+
+
+def list_files(path):
+    """
+    List the files, not directories, directly inside a folder.
+
+    :param path: Folder path.
+    :return: Iterator of (file name, file path) tuples.
+    """
+
+    if hasattr(os, 'scandir'):
+        # File type comes with the directory entry, no stat() per file
+        for entry in os.scandir(path):
+            if entry.is_file():
+                yield entry.name, entry.path
+    else:
+        for f in os.listdir(path):
+            abs_file = join(path, f)
+            if isfile(abs_file):
+                yield f, abs_file
 
 
-def copy_folder(src, dst):
+def copy_files(file_pairs, pool):
+    """
+    Copy files concurrently. Destination directories must already exist.
+
+    :param file_pairs: List of (source, destination) file paths.
+    :param pool: Thread pool to copy the files with.
+    :return: None.
+    """
+
+    if not file_pairs:
+        return
+    pool.map(lambda pair: copy_file(*pair), file_pairs)
+
+
+def copy_folder(src, dst, pool):
     """
     Copy contents of folder in mbed-os listed path.
 
     :param src: Source folder path.
     :param dst: Destination folder path.
+    :param pool: Thread pool to copy the files with.
     :return: None.
     """
 
-    files = os.listdir(src)
-    for f in files:
-        abs_src_file = join(src, f)
-        if isfile(abs_src_file):
-            abs_dst_file = join(dst, f)
-            mkdir(dirname(abs_dst_file))
-            copy_file(abs_src_file, abs_dst_file)
+    file_pairs = [(abs_src_file, join(dst, f))
+                  for f, abs_src_file in list_files(src)]
+    if file_pairs:
+        mkdir(dst)
+    copy_files(file_pairs, pool)
 
 
 def import_files(repo_path, data_files, data_folders):
@@ -112,9 +167,10 @@ def import_files(repo_path, data_files, data_folders):
     """
 
     # Remove all files listed in .json from mbed-os repo to avoid duplications
+    file_index = index_files()
     for fh in data_files:
         src_file = fh['src_file']
-        del_file(os.path.basename(src_file))
+        del_file(os.path.basename(src_file), file_index)
         dest_file = join(ROOT, fh['dest_file'])
         if isfile(dest_file):
             os.remove(join(ROOT, dest_file))
@@ -126,19 +182,28 @@ def import_files(repo_path, data_files, data_folders):
     rel_log.info("Removed files/folders listed in json file")
 
     # Copy all the files listed in json file to mbed-os
+    file_pairs = []
     for fh in data_files:
         repo_file = join(repo_path, fh['src_file'])
         mbed_path = join(ROOT, fh['dest_file'])
-        mkdir(dirname(mbed_path))
-        copy_file(repo_file, mbed_path)
-        rel_log.debug("Copied %s to %s", normpath(repo_file),
-                      normpath(mbed_path))
-    for folder in data_folders:
-        repo_folder = join(repo_path, folder['src_folder'])
-        mbed_path = join(ROOT, folder['dest_folder'])
-        copy_folder(repo_folder, mbed_path)
-        rel_log.debug("Copied %s to %s", normpath(repo_folder),
-                      normpath(mbed_path))
+        file_pairs.append((repo_file, mbed_path))
+    for mbed_dir in set(dirname(mbed_path) for _, mbed_path in file_pairs):
+        mkdir(mbed_dir)
+    pool = ThreadPool(COPY_JOBS)
+    try:
+        copy_files(file_pairs, pool)
+        for repo_file, mbed_path in file_pairs:
+            rel_log.debug("Copied %s to %s", normpath(repo_file),
+                          normpath(mbed_path))
+        for folder in data_folders:
+            repo_folder = join(repo_path, folder['src_folder'])
+            mbed_path = join(ROOT, folder['dest_folder'])
+            copy_folder(repo_folder, mbed_path, pool)
+            rel_log.debug("Copied %s to %s", normpath(repo_folder),
+                          normpath(mbed_path))
+    finally:
+        pool.close()
+        pool.join()
 
 
 def run_cmd_with_output(command, exit_on_failure=False):
@@ -224,16 +289,12 @@ def get_last_cherry_pick_sha():
     :return: SHA if found, None otherwise.
     """
 
-    get_commit = ['git', 'log', '-n', '1']
+    get_commit = ['git', 'log', '-n', '1', '--format=%B']
     _, output = run_cmd_with_output(get_commit, exit_on_failure=True)
 
-    shas = re.findall(
-        pattern='^\s*\(cherry picked from commit ([0-9a-fA-F]+)\)$',
-        string=output.decode('utf-8'),
-        flags=re.MULTILINE
-    )
+    shas = CHERRY_PICK_PATTERN.findall(output)
 
-    return shas[-1] if shas else None
+    return shas[-1].decode('utf-8') if shas else None
 
 
 def normalize_commit_sha(sha_lst):
@@ -18,6 +18,7 @@ limitations under the License.
 import os
 import json
 import pytest
+from collections import Counter
 from mock import patch
 from hypothesis import given
 from hypothesis.strategies import sampled_from
@@ -49,7 +50,7 @@ def compare_config(cfg, expected):
     except KeyError:
         return "Unexpected key '%s' in configuration data" % k
     for k in expected:
-        if k not in NOT_CONFIG + list(cfg.keys()):
+        if k not in NOT_CONFIG and k not in cfg:
             return "Expected key '%s' was not found in configuration data" % k
     return ""
 
@@ -67,17 +68,29 @@ def is_test(path):
     """
     return isfile(data_path(path))
 
+def list_tests(path):
+    """The names of the tests found in a directory
+
+    :param path: the directory containing the tests
+    """
+    if hasattr(os, "scandir"):
+        # Directory entries carry their type, so files need no stat()
+        dirs = ((e.name, e.path) for e in os.scandir(path) if e.is_dir())
+    else:
+        dirs = ((d, join(path, d)) for d in os.listdir(path))
+    return [name for name, test_dir in dirs if is_test(test_dir)]
+
 root_dir = abspath(dirname(__file__))
 
-@pytest.mark.parametrize("name", filter(lambda d: is_test(join(root_dir, d)),
-                                        os.listdir(root_dir)))
+@pytest.mark.parametrize("name", list_tests(root_dir))
 def test_config(name):
     """Run a particular configuration test
 
     :param name: test name (same as directory name)
     """
     test_dir = join(root_dir, name)
-    test_data = json.load(open(data_path(test_dir)))
+    with open(data_path(test_dir)) as fd:
+        test_data = json.load(fd)
     targets_json = os.path.join(test_dir, "targets.json")
     set_targets_json_location(targets_json if isfile(targets_json) else None)
     for target, expected in test_data.items():
@@ -90,9 +103,9 @@ def test_config(name):
 
             if expected_macros is not None:
                 macros = Config.config_macros_to_macros(macros)
-                assert sorted(expected_macros) == sorted(macros)
+                assert Counter(expected_macros) == Counter(macros)
             if expected_features is not None:
-                assert sorted(expected_features) == sorted(features)
+                assert Counter(expected_features) == Counter(features)
 
             included_source = [
                 normpath(join(test_dir, src)) for src in
@@ -21,7 +21,6 @@ limitations
 from argparse import ArgumentParser
 import os
 from os.path import dirname, abspath, basename
-from prettytable import PrettyTable
 import os.path
 import sys
 import subprocess
@@ -35,14 +34,23 @@ sys.path.insert(0, ROOT)
 from tools.utils import argparse_force_uppercase_type
 from tools.utils import argparse_many
 from tools.build_api import get_mbed_official_release
+from tools.targets import cached
 import examples_lib as lib
 from examples_lib import SUPPORTED_TOOLCHAINS, SUPPORTED_IDES
 
+@cached
+def official_target_names():
+    """Names of the official mbed OS 5 targets, only worked out when a
+    subcommand needs them"""
+    return [x[0] for x in get_mbed_official_release("5")]
+
+def official_target_type(string):
+    """Validate an MCU name against the official targets"""
+    return argparse_force_uppercase_type(
+        official_target_names(), "MCU")(string)
+
 def parse_args():    
     """Parse the arguments passed to the script."""
-    official_targets = get_mbed_official_release("5")
-    official_target_names = [x[0] for x in official_targets]
-
 
     parser = ArgumentParser()
     parser.add_argument("-c", dest="config", default="examples.json")
@@ -72,13 +80,11 @@ def parse_args():
         type=argparse_force_uppercase_type(SUPPORTED_TOOLCHAINS,
                                            "toolchain")),
     compile_cmd.add_argument("-m", "--mcu",
-                             help=("build for the given MCU (%s)" %
-                                ', '.join(official_target_names)),
+                             help=("build for the given MCU "
+                                   "(default: all official targets)"),
                             metavar="MCU",
-                            type=argparse_many(
-                                argparse_force_uppercase_type(
-                                    official_target_names, "MCU")),
-                            default=official_target_names)
+                            type=argparse_many(official_target_type),
+                            default=None)
 
     compile_cmd.add_argument(
         "--profiles",
@@ -107,21 +113,22 @@ def parse_args():
         type=argparse_force_uppercase_type(SUPPORTED_IDES,
                                            "ide"))
     export_cmd.add_argument("-m", "--mcu",
-                             help=("build for the given MCU (%s)" %
-                                ', '.join(official_target_names)),
+                             help=("build for the given MCU "
+                                   "(default: all official targets)"),
                             metavar="MCU",
-                            type=argparse_many(
-                                argparse_force_uppercase_type(
-                                    official_target_names, "MCU")),
-                            default=official_target_names)
-    return parser.parse_args()
+                            type=argparse_many(official_target_type),
+                            default=None)
+    args = parser.parse_args()
+    if "mcu" in args and args.mcu is None:
+        args.mcu = official_target_names()
+    return args
 
 
 def main():
     """Entry point"""
     args = parse_args()
-    config = json.load(open(os.path.join(os.path.dirname(__file__),
-                               args.config)))
+    with open(os.path.join(os.path.dirname(__file__), args.config)) as fd:
+        config = json.load(fd)
 
     all_examples = []
     for example in config['examples']:
@@ -130,7 +137,8 @@ def main():
             exit("ERROR : repo basename '%s' and example name '%s' not match " % (name, example['name']))
         all_examples.append(name)
 
-    exp_filter = [x for x in all_examples if x in args.example] if args.example else all_examples
+    wanted = frozenset(args.example)
+    exp_filter = [x for x in all_examples if x in wanted] if wanted else all_examples
 
     return args.fn(args, config, exp_filter)
 
@@ -170,6 +178,7 @@ def do_update(args, config, examples):
 
 def do_list(_, config, examples):
     """List the examples in the config file"""
+    from prettytable import PrettyTable
     exp_table = PrettyTable()
     exp_table.hrules =  1
     exp_table.field_names = ["Name", "Subs", "Feature", "Targets", "Compile", "Test"]
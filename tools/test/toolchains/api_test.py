@@ -18,8 +18,9 @@ limitations under the License.
 
 import sys
 import os
+from itertools import chain
 from string import printable
-from copy import deepcopy
+import pytest
 from mock import MagicMock, patch
 from hypothesis import given, settings, HealthCheck
 from hypothesis.strategies import text, lists, fixed_dictionaries, booleans
@@ -39,15 +40,43 @@ from tools.resources import LEGACY_TOOLCHAIN_NAMES, Resources, FileType
 from tools.targets import TARGET_MAP, set_targets_json_location
 from tools.notifier.mock import MockNotifier
 
-ALPHABET = [char for char in printable if char not in [u'.', u'/', u'\\']]
+ALPHABET = "".join(char for char in printable if char not in u"./\\")
 
-#Create a global test target
-test_target_map = TARGET_MAP["K64F"]
-#We have to add ARMC5,UARM here to supported_toolchains, otherwise the creation of ARM class would fail as it won't find ARMC5 entry in supported_toolchains
-#We also have to add uARM, cause, ARM_MICRO class would check for both uARM and ARMC5 in supported_toolchains(as ARM_MICRO represents ARMC5+Micro).
-#And do this globally here so all tests can use this
-test_target_map.supported_toolchains.append("ARMC5")
-test_target_map.supported_toolchains.append("uARM")
+# The profile tests run once per toolchain, so split Hypothesis' default
+# budget of 100 examples between them to keep a serial run as long as it was
+PROFILE_EXAMPLES = max(10, 100 // len(TOOLCHAIN_CLASSES))
+
+
+@pytest.fixture(scope="module")
+def k64f_target():
+    """The test target, set up once for all of the tests in this module
+
+    :return: the K64F target
+    """
+    # Other modules, such as the config tests, may have pointed the targets
+    # at a targets.json without K64F
+    set_targets_json_location()
+    target = TARGET_MAP["K64F"]
+    supported_toolchains = list(target.supported_toolchains)
+    #We have to add ARMC5,UARM here to supported_toolchains, otherwise the creation of ARM class would fail as it won't find ARMC5 entry in supported_toolchains
+    #We also have to add uARM, cause, ARM_MICRO class would check for both uARM and ARMC5 in supported_toolchains(as ARM_MICRO represents ARMC5+Micro).
+    target.supported_toolchains.append("ARMC5")
+    target.supported_toolchains.append("uARM")
+    yield target
+    # Leave the shared target as later modules expect to find it
+    target.supported_toolchains[:] = supported_toolchains
+
+
+def command_contains(command):
+    """Build a check for whether a string occurs within any one argument of
+    command, searching all of the arguments at once"""
+    joined = "\0".join(command)
+    def contains(parameter):
+        # Only a match that includes the separator can span two arguments
+        if "\0" in parameter:
+            return any(parameter in cmd for cmd in command)
+        return parameter in joined
+    return contains
 
 
 @patch('tools.toolchains.arm.run_cmd')
@@ -182,6 +211,7 @@ def test_gcc_version_check(_run_cmd):
     assert len(notifier.messages) == 3
 
 
+@pytest.mark.parametrize("toolchain_name", sorted(TOOLCHAIN_CLASSES))
 @given(fixed_dictionaries({
     'common': lists(text()),
     'c': lists(text()),
@@ -189,32 +219,36 @@ def test_gcc_version_check(_run_cmd):
     'asm': lists(text()),
     'ld': lists(text())}),
        lists(text(min_size=1, alphabet=ALPHABET), min_size=1))
-@settings(suppress_health_check=[HealthCheck.too_slow])
-def test_toolchain_profile_c(profile, source_file):
+@settings(max_examples=PROFILE_EXAMPLES,
+          suppress_health_check=[HealthCheck.too_slow])
+def test_toolchain_profile_c(toolchain_name, k64f_target, profile,
+                             source_file):
     """Test that the appropriate profile parameters are passed to the
     C compiler"""
-    filename = deepcopy(source_file)
+    filename = list(source_file)
     filename[-1] += ".c"
     to_compile = os.path.join(*filename)
-    set_targets_json_location()
     with patch('os.mkdir') as _mkdir:
-        for _, tc_class in TOOLCHAIN_CLASSES.items():
-            toolchain = tc_class(test_target_map, build_profile=profile,
-                                 notify=MockNotifier())
-            toolchain.inc_md5 = ""
-            toolchain.build_dir = ""
-            toolchain.config = MagicMock(app_config_location=None)
-            for parameter in profile['c'] + profile['common']:
-                assert any(parameter in cmd for cmd in toolchain.cc), \
-                    "Toolchain %s did not propagate arg %s" % (toolchain.name,
-                                                            parameter)
-            compile_command = toolchain.compile_command(to_compile,
-                                                        to_compile + ".o", [])
-            for parameter in profile['c'] + profile['common']:
-                assert any(parameter in cmd for cmd in compile_command), \
-                    "Toolchain %s did not propagate arg %s" % (toolchain.name,
-                                                            parameter)
+        tc_class = TOOLCHAIN_CLASSES[toolchain_name]
+        toolchain = tc_class(k64f_target, build_profile=profile,
+                             notify=MockNotifier())
+        toolchain.inc_md5 = ""
+        toolchain.build_dir = ""
+        toolchain.config = MagicMock(app_config_location=None)
+        in_cc = command_contains(toolchain.cc)
+        for parameter in profile['c'] + profile['common']:
+            assert in_cc(parameter), \
+                "Toolchain %s did not propagate arg %s" % (toolchain.name,
+                                                        parameter)
+        compile_command = toolchain.compile_command(to_compile,
+                                                    to_compile + ".o", [])
+        arguments = set(chain.from_iterable(compile_command))
+        for parameter in profile['c'] + profile['common']:
+            assert parameter in arguments, \
+                "Toolchain %s did not propagate arg %s" % (toolchain.name,
+                                                        parameter)
 
+@pytest.mark.parametrize("toolchain_name", sorted(TOOLCHAIN_CLASSES))
 @given(fixed_dictionaries({
     'common': lists(text()),
     'c': lists(text()),
@@ -222,31 +256,36 @@ def test_toolchain_profile_c(profile, source_file):
     'asm': lists(text()),
     'ld': lists(text())}),
        lists(text(min_size=1, alphabet=ALPHABET), min_size=1))
-@settings(suppress_health_check=[HealthCheck.too_slow])
-def test_toolchain_profile_cpp(profile, source_file):
+@settings(max_examples=PROFILE_EXAMPLES,
+          suppress_health_check=[HealthCheck.too_slow])
+def test_toolchain_profile_cpp(toolchain_name, k64f_target, profile,
+                               source_file):
     """Test that the appropriate profile parameters are passed to the
     C++ compiler"""
-    filename = deepcopy(source_file)
+    filename = list(source_file)
     filename[-1] += ".cpp"
     to_compile = os.path.join(*filename)
     with patch('os.mkdir') as _mkdir:
-        for _, tc_class in TOOLCHAIN_CLASSES.items():
-            toolchain = tc_class(test_target_map, build_profile=profile,
-                                 notify=MockNotifier())
-            toolchain.inc_md5 = ""
-            toolchain.build_dir = ""
-            toolchain.config = MagicMock(app_config_location=None)
-            for parameter in profile['cxx'] + profile['common']:
-                assert any(parameter in cmd for cmd in toolchain.cppc), \
-                    "Toolchain %s did not propagate arg %s" % (toolchain.name,
-                                                            parameter)
-            compile_command = toolchain.compile_command(to_compile,
-                                                        to_compile + ".o", [])
-            for parameter in profile['cxx'] + profile['common']:
-                assert any(parameter in cmd for cmd in compile_command), \
-                    "Toolchain %s did not propagate arg %s" % (toolchain.name,
-                                                            parameter)
+        tc_class = TOOLCHAIN_CLASSES[toolchain_name]
+        toolchain = tc_class(k64f_target, build_profile=profile,
+                             notify=MockNotifier())
+        toolchain.inc_md5 = ""
+        toolchain.build_dir = ""
+        toolchain.config = MagicMock(app_config_location=None)
+        in_cppc = command_contains(toolchain.cppc)
+        for parameter in profile['cxx'] + profile['common']:
+            assert in_cppc(parameter), \
+                "Toolchain %s did not propagate arg %s" % (toolchain.name,
+                                                        parameter)
+        compile_command = toolchain.compile_command(to_compile,
+                                                    to_compile + ".o", [])
+        arguments = set(chain.from_iterable(compile_command))
+        for parameter in profile['cxx'] + profile['common']:
+            assert parameter in arguments, \
+                "Toolchain %s did not propagate arg %s" % (toolchain.name,
+                                                        parameter)
 
+@pytest.mark.parametrize("toolchain_name", sorted(TOOLCHAIN_CLASSES))
 @given(fixed_dictionaries({
     'common': lists(text()),
     'c': lists(text()),
@@ -254,38 +293,39 @@ def test_toolchain_profile_cpp(profile, source_file):
     'asm': lists(text()),
     'ld': lists(text())}),
        lists(text(min_size=1, alphabet=ALPHABET), min_size=1))
-@settings(suppress_health_check=[HealthCheck.too_slow])
-def test_toolchain_profile_asm(profile, source_file):
+@settings(max_examples=PROFILE_EXAMPLES,
+          suppress_health_check=[HealthCheck.too_slow])
+def test_toolchain_profile_asm(toolchain_name, k64f_target, profile,
+                               source_file):
     """Test that the appropriate profile parameters are passed to the
     Assembler"""
-    filename = deepcopy(source_file)
+    filename = list(source_file)
     filename[-1] += ".s"
     to_compile = os.path.join(*filename)
     with patch('os.mkdir') as _mkdir:
-        for _, tc_class in TOOLCHAIN_CLASSES.items():
-            toolchain = tc_class(test_target_map, build_profile=profile,
-                                 notify=MockNotifier())
-            toolchain.inc_md5 = ""
-            toolchain.build_dir = ""
-            toolchain.config = MagicMock()
-            toolchain.config.get_config_data_macros.return_value = []
-            for parameter in profile['asm']:
-                assert any(parameter in cmd for cmd in toolchain.asm), \
-                    "Toolchain %s did not propagate arg %s" % (toolchain.name,
-                                                               parameter)
-            compile_command = toolchain.compile_command(to_compile,
-                                                        to_compile + ".o", [])
-            if not compile_command:
-                assert compile_command, to_compile
-            for parameter in profile['asm']:
-                assert any(parameter in cmd for cmd in compile_command), \
-                    "Toolchain %s did not propagate arg %s" % (toolchain.name,
-                                                               parameter)
-
-    for name, Class in  TOOLCHAIN_CLASSES.items():
-        CLS = Class(test_target_map, notify=MockNotifier())
-        assert name == CLS.name or name ==  LEGACY_TOOLCHAIN_NAMES[CLS.name]
+        tc_class = TOOLCHAIN_CLASSES[toolchain_name]
+        toolchain = tc_class(k64f_target, build_profile=profile,
+                             notify=MockNotifier())
+        toolchain.inc_md5 = ""
+        toolchain.build_dir = ""
+        toolchain.config = MagicMock()
+        toolchain.config.get_config_data_macros.return_value = []
+        in_asm = command_contains(toolchain.asm)
+        for parameter in profile['asm']:
+            assert in_asm(parameter), \
+                "Toolchain %s did not propagate arg %s" % (toolchain.name,
+                                                           parameter)
+        compile_command = toolchain.compile_command(to_compile,
+                                                    to_compile + ".o", [])
+        if not compile_command:
+            assert compile_command, to_compile
+        arguments = set(chain.from_iterable(compile_command))
+        for parameter in profile['asm']:
+            assert parameter in arguments, \
+                "Toolchain %s did not propagate arg %s" % (toolchain.name,
+                                                           parameter)
 
+@pytest.mark.parametrize("toolchain_name", sorted(TOOLCHAIN_CLASSES))
 @given(fixed_dictionaries({
     'common': lists(text()),
     'c': lists(text()),
@@ -293,37 +333,45 @@ def test_toolchain_profile_asm(profile, source_file):
     'asm': lists(text()),
     'ld': lists(text(min_size=1))}),
        lists(text(min_size=1, alphabet=ALPHABET), min_size=1))
-@settings(suppress_health_check=[HealthCheck.too_slow])
-def test_toolchain_profile_ld(profile, source_file):
+@settings(max_examples=PROFILE_EXAMPLES,
+          suppress_health_check=[HealthCheck.too_slow])
+def test_toolchain_profile_ld(toolchain_name, k64f_target, profile,
+                              source_file):
     """Test that the appropriate profile parameters are passed to the
     Linker"""
-    filename = deepcopy(source_file)
+    filename = list(source_file)
     filename[-1] += ".o"
     to_compile = os.path.join(*filename)
     with patch('os.mkdir') as _mkdir,\
          patch('tools.toolchains.mbedToolchain.default_cmd') as _dflt_cmd:
-        for _, tc_class in TOOLCHAIN_CLASSES.items():
-            toolchain = tc_class(test_target_map, build_profile=profile,
-                                 notify=MockNotifier())
-            toolchain.RESPONSE_FILES = False
-            toolchain.inc_md5 = ""
-            toolchain.build_dir = ""
-            for parameter in profile['ld']:
-                assert any(parameter in cmd for cmd in toolchain.ld), \
-                    "Toolchain %s did not propagate arg %s" % (toolchain.name,
-                                                               parameter)
-            toolchain.link(to_compile + ".elf", [to_compile], [], [], None)
-            compile_cmd = _dflt_cmd.call_args_list
-            if not compile_cmd:
-                assert compile_cmd, to_compile
-            for parameter in profile['ld']:
-                assert any(parameter in cmd[0][0] for cmd in compile_cmd), \
-                    "Toolchain %s did not propagate arg %s" % (toolchain.name,
-                                                               parameter)
-
-    for name, Class in  TOOLCHAIN_CLASSES.items():
-        CLS = Class(test_target_map, notify=MockNotifier())
-        assert name == CLS.name or name ==  LEGACY_TOOLCHAIN_NAMES[CLS.name]
+        tc_class = TOOLCHAIN_CLASSES[toolchain_name]
+        toolchain = tc_class(k64f_target, build_profile=profile,
+                             notify=MockNotifier())
+        toolchain.RESPONSE_FILES = False
+        toolchain.inc_md5 = ""
+        toolchain.build_dir = ""
+        in_ld = command_contains(toolchain.ld)
+        for parameter in profile['ld']:
+            assert in_ld(parameter), \
+                "Toolchain %s did not propagate arg %s" % (toolchain.name,
+                                                           parameter)
+        toolchain.link(to_compile + ".elf", [to_compile], [], [], None)
+        compile_cmd = _dflt_cmd.call_args_list
+        if not compile_cmd:
+            assert compile_cmd, to_compile
+        for parameter in profile['ld']:
+            assert any(parameter in cmd[0][0] for cmd in compile_cmd), \
+                "Toolchain %s did not propagate arg %s" % (toolchain.name,
+                                                           parameter)
+
+def test_toolchain_instantiation(k64f_target):
+    """Test that each toolchain class is registered under its own name or
+    its legacy name"""
+    for name, Class in TOOLCHAIN_CLASSES.items():
+        CLS = Class(k64f_target, notify=MockNotifier())
+        legacy_name = LEGACY_TOOLCHAIN_NAMES.get(CLS.name)
+        assert name == CLS.name or name == legacy_name
+
 
 
 @given(lists(text(alphabet=ALPHABET, min_size=1), min_size=1))
@@ -345,7 +393,7 @@ def test_detect_duplicates(filenames):
     assert "dupe.c" in notification["message"]
     assert "dupe.cpp" in notification["message"]
 
-@given(text(alphabet=ALPHABET + [os.sep], min_size=1))
+@given(text(alphabet=ALPHABET + os.sep, min_size=1))
 @given(booleans())
 @given(booleans())
 @settings(max_examples=20)
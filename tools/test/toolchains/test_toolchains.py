@@ -9,9 +9,6 @@ import os
 import sys
 from unittest import TestCase
 
-import mock
-
-
 ROOT = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "..", "..", "..")
 )
@@ -23,18 +20,44 @@ from tools.toolchains.iar import IAR
 from tools.toolchains.mbed_toolchain import UNSUPPORTED_C_LIB_EXCEPTION_STRING
 from tools.utils import NotSupportedException
 
+
+class MockTarget(object):
+    """A minimal stand-in for tools.targets.Target.
+
+    Only holds the attributes a test passes in, plus the ones the toolchain
+    constructors read from every target, which is much cheaper than
+    building a MagicMock for each test.
+    """
+
+    build_tools_metadata = {"version": 1, "public": False}
+    is_TFM_target = False
+
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+    @property
+    def core_without_NS(self):
+        if self.core.endswith('-NS'):
+            return self.core[:-3]
+        return self.core
+
+    @property
+    def is_TrustZone_non_secure_target(self):
+        return self.core.endswith('-NS')
+
+
 class TestArmToolchain(TestCase):
     """Test Arm classes."""
 
     def test_arm_minimal_printf(self):
         """Test that linker flags are correctly added to an instance of ARM."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.printf_lib = "minimal-printf"
-        mock_target.c_lib = "std"
-        mock_target.supported_c_libs = {"arm": ["std"]}
-        mock_target.supported_toolchains = ["ARM", "uARM", "ARMC5"]
-        del mock_target.default_lib
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            printf_lib="minimal-printf",
+            c_lib="std",
+            supported_c_libs={"arm": ["std"]},
+            supported_toolchains=["ARM", "uARM", "ARMC5"]
+        )
         arm_std_obj = ARM_STD(mock_target)
         arm_micro_obj = ARM_MICRO(mock_target)
         arm_c6_obj = ARMC6(mock_target)
@@ -45,13 +68,13 @@ class TestArmToolchain(TestCase):
 
     def test_arm_c_lib(self):
         """Test that linker flags are correctly added to an instance of ARM."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.supported_c_libs = {"arm": ["small"]}
-        mock_target.c_lib = "sMALL"
-        del mock_target.default_lib
-        mock_target.default_toolchain = "ARM"
-        mock_target.supported_toolchains = ["ARM", "uARM", "ARMC5", "ARMC6"]
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            supported_c_libs={"arm": ["small"]},
+            c_lib="sMALL",
+            default_toolchain="ARM",
+            supported_toolchains=["ARM", "uARM", "ARMC5", "ARMC6"]
+        )
         arm_std_obj = ARM_STD(mock_target)
         arm_micro_obj = ARM_MICRO(mock_target)
 
@@ -69,13 +92,13 @@ class TestArmToolchain(TestCase):
 
     def test_arm_c_lib_std_exception(self):
         """Test that an exception is raised if the std C library is not supported for a target on the ARM toolchain."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.supported_toolchains = ["ARM", "uARM", "ARMC5"]
-        mock_target.default_toolchain = "ARM"
-        mock_target.c_lib = "std"
-        del mock_target.default_lib
-        mock_target.supported_c_libs = {"arm": ["small"]}
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            supported_toolchains=["ARM", "uARM", "ARMC5"],
+            default_toolchain="ARM",
+            c_lib="std",
+            supported_c_libs={"arm": ["small"]}
+        )
         with self.assertRaisesRegexp(NotSupportedException, UNSUPPORTED_C_LIB_EXCEPTION_STRING.format(mock_target.c_lib)):
             ARM_STD(mock_target)
         with self.assertRaisesRegexp(NotSupportedException, UNSUPPORTED_C_LIB_EXCEPTION_STRING.format(mock_target.c_lib)):
@@ -84,13 +107,13 @@ class TestArmToolchain(TestCase):
 
     def test_arm_c_lib_small_exception(self):
         """Test that an exception is raised if the small and std C library are not supported for a target on the ARM toolchain."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.c_lib = "small"
-        del mock_target.default_lib
-        mock_target.supported_c_libs = {"arm": [""]}
-        mock_target.default_toolchain = "ARM"
-        mock_target.supported_toolchains = ["ARM", "uARM", "ARMC5"]
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            c_lib="small",
+            supported_c_libs={"arm": [""]},
+            default_toolchain="ARM",
+            supported_toolchains=["ARM", "uARM", "ARMC5"]
+        )
         with self.assertRaisesRegexp(NotSupportedException, UNSUPPORTED_C_LIB_EXCEPTION_STRING.format(mock_target.c_lib)):
             ARM_STD(mock_target)
         mock_target.default_toolchain = "ARMC6"
@@ -99,12 +122,12 @@ class TestArmToolchain(TestCase):
 
     def test_arm_small_c_lib_swap_std_lib(self):
         """Test that no exception is raised when small c lib is not supported but std lib is supported."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.c_lib = "small"
-        del mock_target.default_lib
-        mock_target.supported_c_libs = {"arm": ["std"]}
-        mock_target.supported_toolchains = ["ARM", "uARM", "ARMC5"]
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            c_lib="small",
+            supported_c_libs={"arm": ["std"]},
+            supported_toolchains=["ARM", "uARM", "ARMC5"]
+        )
 
         mock_target.default_toolchain = "ARM"
         try:
@@ -123,13 +146,13 @@ class TestGccToolchain(TestCase):
 
     def test_gcc_minimal_printf(self):
         """Test that linker flags are correctly added to an instance of GCC_ARM."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.printf_lib = "minimal-printf"
-        mock_target.supported_toolchains = ["GCC_ARM"]
-        mock_target.c_lib = "std"
-        del mock_target.default_lib
-        mock_target.supported_c_libs = {"gcc_arm": ["std"]}
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            printf_lib="minimal-printf",
+            supported_toolchains=["GCC_ARM"],
+            c_lib="std",
+            supported_c_libs={"gcc_arm": ["std"]}
+        )
 
         gcc_obj = GCC_ARM(mock_target)
 
@@ -151,12 +174,12 @@ class TestGccToolchain(TestCase):
 
     def test_gcc_arm_c_lib(self):
         """Test that linker flags are correctly added to an instance of GCC_ARM."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.supported_c_libs = {"gcc_arm": ["small"]}
-        mock_target.c_lib = "sMALL"
-        del mock_target.default_lib
-        mock_target.supported_toolchains = ["GCC_ARM"]
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            supported_c_libs={"gcc_arm": ["small"]},
+            c_lib="sMALL",
+            supported_toolchains=["GCC_ARM"]
+        )
         gcc_arm_obj = GCC_ARM(mock_target)
         self.assertIn("-DMBED_RTOS_SINGLE_THREAD", gcc_arm_obj.flags["common"])
         self.assertIn("-D__NEWLIB_NANO", gcc_arm_obj.flags["common"])
@@ -164,37 +187,37 @@ class TestGccToolchain(TestCase):
 
     def test_gcc_arm_c_lib_std_exception(self):
         """Test that an exception is raised if the std C library is not supported for a target on the GCC_ARM toolchain."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.default_toolchain = "GCC_ARM"
-        mock_target.c_lib = "std"
-        del mock_target.default_lib
-        mock_target.supported_c_libs = {"gcc_arm": ["small"]}
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            default_toolchain="GCC_ARM",
+            c_lib="std",
+            supported_c_libs={"gcc_arm": ["small"]}
+        )
         with self.assertRaisesRegexp(NotSupportedException, UNSUPPORTED_C_LIB_EXCEPTION_STRING.format(mock_target.c_lib)):
             GCC_ARM(mock_target)
 
     def test_gcc_arm_c_lib_small_exception(self):
         """Test that an exception is raised if the small and std C library are not supported for a target on the GCC_ARM toolchain."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.c_lib = "small"
-        del mock_target.default_lib
-        mock_target.supported_c_libs = {"gcc_arm": [""]}
-        mock_target.default_toolchain = "GCC_ARM"
-        mock_target.supported_toolchains = ["GCC_ARM"]
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            c_lib="small",
+            supported_c_libs={"gcc_arm": [""]},
+            default_toolchain="GCC_ARM",
+            supported_toolchains=["GCC_ARM"]
+        )
         with self.assertRaisesRegexp(NotSupportedException, UNSUPPORTED_C_LIB_EXCEPTION_STRING.format(mock_target.c_lib)):
             GCC_ARM(mock_target)
 
     def test_gcc_arm_small_c_lib_swap_std_lib(self):
         """Test that no exception is raised when small c lib is not supported but std lib is supported."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.supported_c_libs = {"gcc_arm": ["std"]}
-        mock_target.c_lib = "small"
-        del mock_target.default_lib
-        mock_target.supported_toolchains = ["GCC_ARM"]
-        mock_target.is_TrustZone_secure_target = False
-        mock_target.default_toolchain = "GCC_ARM"
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            supported_c_libs={"gcc_arm": ["std"]},
+            c_lib="small",
+            supported_toolchains=["GCC_ARM"],
+            is_TrustZone_secure_target=False,
+            default_toolchain="GCC_ARM"
+        )
         try:
             GCC_ARM(mock_target)
         except NotSupportedException:
@@ -204,13 +227,13 @@ class TestIarToolchain(TestCase):
 
     def test_iar_minimal_printf(self):
         """Test that linker flags are correctly added to an instance of IAR."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.printf_lib = "minimal-printf"
-        mock_target.supported_toolchains = ["IAR"]
-        del mock_target.default_lib
-        mock_target.c_lib = "std"
-        mock_target.supported_c_libs = {"iar": ["std"]}
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            printf_lib="minimal-printf",
+            supported_toolchains=["IAR"],
+            c_lib="std",
+            supported_c_libs={"iar": ["std"]}
+        )
 
         iar_obj = IAR(mock_target)
         var = "-DMBED_MINIMAL_PRINTF"
@@ -218,12 +241,12 @@ class TestIarToolchain(TestCase):
 
     def test_iar_c_lib(self):
         """Test that no exception is raised when a supported c library is specified."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.supported_c_libs = {"iar": ["std"]}
-        mock_target.c_lib = "sTD"
-        del mock_target.default_lib
-        mock_target.supported_toolchains = ["IAR"]
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            supported_c_libs={"iar": ["std"]},
+            c_lib="sTD",
+            supported_toolchains=["IAR"]
+        )
         try:
             IAR(mock_target)
         except NotSupportedException:
@@ -231,35 +254,35 @@ class TestIarToolchain(TestCase):
 
     def test_iar_c_lib_std_exception(self):
         """Test that an exception is raised if the std C library is not supported for a target on the IAR toolchain."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.c_lib = "std"
-        del mock_target.default_lib
-        mock_target.supported_c_libs = {"iar": ["small"]}
-        mock_target.supported_toolchains = ["IAR"]
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            c_lib="std",
+            supported_c_libs={"iar": ["small"]},
+            supported_toolchains=["IAR"]
+        )
         with self.assertRaisesRegexp(NotSupportedException, UNSUPPORTED_C_LIB_EXCEPTION_STRING.format(mock_target.c_lib)):
             IAR(mock_target)
 
     def test_iar_c_lib_small_exception(self):
         """Test that an exception is raised if the small and std C library are not supported for a target on the IAR toolchain."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.c_lib = "small"
-        del mock_target.default_lib
-        mock_target.supported_c_libs = {"iar": [""]}
-        mock_target.supported_toolchains = ["IAR"]
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            c_lib="small",
+            supported_c_libs={"iar": [""]},
+            supported_toolchains=["IAR"]
+        )
         with self.assertRaisesRegexp(NotSupportedException, UNSUPPORTED_C_LIB_EXCEPTION_STRING.format(mock_target.c_lib)):
             IAR(mock_target)
 
     def test_iar_small_c_lib_swap_std_lib(self):
         """Test that no exception is raised when small c lib is not supported but std lib is supported."""
-        mock_target = mock.MagicMock()
-        mock_target.core = "Cortex-M4"
-        mock_target.supported_c_libs = {"iar": ["std"]}
-        mock_target.c_lib = "small"
-        del mock_target.default_lib
-        mock_target.supported_toolchains = ["IAR"]
-        mock_target.is_TrustZone_secure_target = False
+        mock_target = MockTarget(
+            core="Cortex-M4",
+            supported_c_libs={"iar": ["std"]},
+            c_lib="small",
+            supported_toolchains=["IAR"],
+            is_TrustZone_secure_target=False
+        )
         try:
             IAR(mock_target)
         except NotSupportedException: